@@ -1,13 +1,23 @@
 import os
+import errno
 import pandas as pd
-import glob
 import shutil
 import json
+import re
+import fnmatch
+import hashlib
 import tkinter as tk
 from tkinter import filedialog, Toplevel, Label, Button, messagebox
+import sys
 import logging
+from collections import Counter
 from pathlib import Path
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+try:
+    import fcntl
+except ImportError:  # Windows has no fcntl; reflinks are simply skipped there
+    fcntl = None
 try:
     import ttkbootstrap as ttk
     from ttkbootstrap.constants import *
@@ -23,6 +33,149 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Linux ioctl that clones a file's extents on CoW filesystems (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+# How files are placed into destinations: physically moved, or linked
+ORGANIZE_MODES = ['move', 'link']
+
+# Link failures that hold for a whole device pair rather than a single file
+DEVICE_LINK_ERRORS = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOTTY, errno.EINVAL}
+
+# ProcessPoolExecutor rejects more workers than this on Windows
+WINDOWS_MAX_PROCESS_WORKERS = 61
+
+# Cumulative work done / seconds spent by past runs, per operation kind
+THROUGHPUT_KEYS = [
+    'rename_ops_total', 'rename_seconds_total',
+    'link_ops_total', 'link_seconds_total',
+    'copy_bytes_total', 'copy_seconds_total',
+]
+
+# Warn when a run would use more than this share of a device's free space
+CAPACITY_WARN_RATIO = 0.9
+
+
+# Directory/file globs pruned from every scan unless the user edits the list
+DEFAULT_SCAN_EXCLUDES = '.git, .svn, .hg, node_modules, __pycache__, .snapshot, .snapshots, $RECYCLE.BIN, System Volume Information'
+
+
+def scan_directory(path, depth, options):
+    """List one directory of the source tree, pruning as configured.
+
+    options holds 'excludes' (glob list), 'max_depth' (None = unlimited),
+    'root_dev' (None = may cross filesystems), 'follow_symlinks' and
+    'skip_dirs' ((st_dev, st_ino) of directories never to enter, e.g.
+    destinations; compared by identity so symlinked/junction paths match).
+    Returns (files, subdirs): files as (path, stat_result) pairs, subdirs as
+    (path, depth, key) still to be listed, where key identifies the directory
+    for symlink-loop detection (None when symlinks are not followed).
+    Excluded subtrees are dropped here, so they are never listed at all.
+    """
+    files, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError as e:
+        logging.warning(f"Skipping unreadable directory {path}: {e}")
+        return files, subdirs
+    follow = options['follow_symlinks']
+    for entry in entries:
+        if any(fnmatch.fnmatch(entry.name, pat) or fnmatch.fnmatch(entry.path, pat) for pat in options['excludes']):
+            continue
+        try:
+            if entry.is_dir(follow_symlinks=follow):
+                if options['max_depth'] is not None and depth >= options['max_depth']:
+                    continue
+                # os.stat rather than entry.stat: on Windows the cached entry
+                # stat has st_dev/st_ino zeroed
+                st = os.stat(entry.path, follow_symlinks=follow)
+                if (st.st_dev, st.st_ino) in options['skip_dirs']:
+                    continue
+                if options['root_dev'] is not None and st.st_dev != options['root_dev']:
+                    continue
+                key = (st.st_dev, st.st_ino) if follow else None
+                subdirs.append((entry.path, depth + 1, key))
+            elif entry.is_file():
+                files.append((entry.path, entry.stat()))
+        except OSError:
+            continue
+    return files, subdirs
+
+
+SHARD_PLACEHOLDER = re.compile(r'^(year|month|day|hash(:\d+)?)$')
+
+
+def invalid_shard_placeholders(template):
+    """Return the placeholders in template that shard_subpath doesn't know."""
+    bad = [name for name in re.findall(r'\{([^{}]*)\}', template) if not SHARD_PLACEHOLDER.match(name)]
+    # stray braces would otherwise end up in folder names as well
+    if '{' in re.sub(r'\{[^{}]*\}', '', template) or '}' in re.sub(r'\{[^{}]*\}', '', template):
+        bad.append('unbalanced braces')
+    return bad
+
+
+OVERFLOW_FOLDER = re.compile(r'^_\d+$')
+
+
+def overflow_folder(base, node, fanout):
+    """Path of overflow folder number node (0 = base) in a fanout-ary tree."""
+    parts = []
+    while node:
+        parts.append(f"_{(node - 1) % fanout + 1}")
+        node = (node - 1) // fanout
+    return os.path.join(base, *reversed(parts))
+
+
+def count_shard_files(path):
+    """Entries in path other than its own overflow folders (0 if missing)."""
+    try:
+        with os.scandir(path) as it:
+            return sum(1 for entry in it if not (OVERFLOW_FOLDER.match(entry.name) and entry.is_dir()))
+    except OSError:
+        return 0
+
+
+def shard_subpath(template, base_filename, mtime):
+    """Expand a per-category sharding template into a relative folder path.
+
+    Supported placeholders: {year}, {month}, {day} (from the file's mtime)
+    and {hash} / {hash:N}, the first N (default 2) hex digits of an MD5 of
+    the file name, e.g. '{year}/{month}' or '{hash:2}/{hash:4}'.
+    """
+    if not template:
+        return ''
+    digest = hashlib.md5(base_filename.encode('utf-8', 'surrogateescape'), usedforsecurity=False).hexdigest()
+    path = re.sub(r'\{hash(?::(\d+))?\}', lambda m: digest[:int(m.group(1) or 2)], template)
+    t = time.localtime(mtime)
+    path = path.replace('{year}', f"{t.tm_year:04d}").replace('{month}', f"{t.tm_mon:02d}").replace('{day}', f"{t.tm_mday:02d}")
+    parts = [part for part in re.split(r'[\\/]+', path) if part and part not in ('.', '..')]
+    return os.path.join(*parts) if parts else ''
+
+
+def format_duration(seconds):
+    """Render a duration as e.g. '2h 05m', '3m 20s' or '12s'."""
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def reflink_file(src, dst):
+    """Create dst as a copy-on-write clone of src (FICLONE)."""
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "reflinks are not supported on this platform")
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.remove(dst)
+            raise
+
+
 class FileOrganizerApp:
     def __init__(self, root):
         self.root = root
@@ -60,7 +213,15 @@ class FileOrganizerApp:
             'video_location': os.path.expanduser("~/Downloads/Video"),
             'setup_files_location': os.path.expanduser("~/Downloads/EXE"),
             'compressed_files_location': os.path.expanduser("~/Downloads/ZIP"),
-            'other_files_location': os.path.expanduser("~/Downloads/Other")
+            'other_files_location': os.path.expanduser("~/Downloads/Other"),
+            'organize_mode': 'move',
+            'scan_excludes': DEFAULT_SCAN_EXCLUDES,
+            'scan_max_depth': 0,
+            'scan_same_filesystem': False,
+            'scan_follow_symlinks': False,
+            'scan_workers': 0,
+            'scan_use_processes': False,
+            'scan_sorted': True
         }
         self.load_config()
 
@@ -71,13 +232,21 @@ class FileOrganizerApp:
 
         # UI state stores
         self.file_type_vars = {}
+        self.file_type_counts = Counter()  # extension -> files found by the last scan
         self.entries = {}          # category -> entry widget for extensions
         self.dest_entries = {}     # category -> entry widget for path
+        self.shard_entries = {}    # category -> (template entry, max entries-per-dir entry)
         self.category_rows = {}    # category -> frame row container
 
         # Last log dataframe for save button
         self.last_log_df = None
 
+        # (source device, destination device) -> link methods that pair can't do
+        self.link_unsupported = {}
+
+        # path -> os.stat_result collected by the last source scan
+        self.scan_stats = {}
+
         # Build UI
         self.create_ui()
 
@@ -112,6 +281,7 @@ class FileOrganizerApp:
         controls.grid(row=5, column=0, columnspan=4, sticky='w', padx=10)
         ttk.Button(controls, text="Add Category", command=self.toggle_add_category_drawer, bootstyle='info', style='TButton').grid(row=0, column=0, padx=(0,8))
         ttk.Button(controls, text="Save Settings", command=self.update_config).grid(row=0, column=1)
+        ttk.Button(controls, text="Scan Options", command=self.toggle_scan_options_drawer, bootstyle='info', style='TButton').grid(row=0, column=2, padx=(8,0))
 
         # Header row
         header = ttk.Frame(self.root)
@@ -119,7 +289,9 @@ class FileOrganizerApp:
         ttk.Label(header, text="Category", width=16).grid(row=0, column=0, sticky='w')
         ttk.Label(header, text="Extensions (comma-separated)", width=34).grid(row=0, column=1, sticky='w')
         ttk.Label(header, text="Destination Folder", width=30).grid(row=0, column=2, sticky='w')
-        ttk.Label(header, text="").grid(row=0, column=3)
+        ttk.Label(header, text="Shard Template", width=14).grid(row=0, column=3, sticky='w')
+        ttk.Label(header, text="Max/Dir", width=8).grid(row=0, column=4, sticky='w')
+        ttk.Label(header, text="").grid(row=0, column=5)
 
         # Scrollable area for category rows
         outer = ttk.Frame(self.root)
@@ -146,6 +318,10 @@ class FileOrganizerApp:
         action_frame.grid(row=9, column=0, columnspan=4, sticky='w', padx=10)
         ttk.Button(action_frame, text="Preview Organization", command=self.preview_organization, bootstyle='secondary', style='TButton').grid(row=0, column=0, pady=5, padx=(0,10))
         ttk.Button(action_frame, text="Organize Files", command=self.organize_files, bootstyle='success', style='TButton').grid(row=0, column=1, pady=5)
+        ttk.Label(action_frame, text="Mode:").grid(row=0, column=2, padx=(16,4))
+        mode = self.config.get('organize_mode', 'move')
+        self.organize_mode_var = tk.StringVar(value=(mode if mode in ORGANIZE_MODES else 'move'))
+        ttk.Combobox(action_frame, textvariable=self.organize_mode_var, values=ORGANIZE_MODES, state="readonly", width=8).grid(row=0, column=3, pady=5)
 
         # Progress
         self.progress = ttk.Progressbar(self.root, length=400, mode='determinate')
@@ -180,10 +356,33 @@ class FileOrganizerApp:
         ttk.Button(btns, text='Add', command=self.add_category_from_drawer, bootstyle='success', style='TButton').grid(row=0, column=0, padx=4)
         ttk.Button(btns, text='Cancel', command=self.cancel_add_category, bootstyle='secondary', style='TButton').grid(row=0, column=1, padx=4)
 
+        # Scan Options Drawer (hidden by default)
+        self.scanopts_drawer = ttk.Labelframe(self.bottom_panel, text='Scan Options')
+        self.scanopts_drawer.grid(row=1, column=0, sticky='ew', pady=(0,8))
+        self.scanopts_drawer.grid_remove()
+        self.scan_excludes_var = tk.StringVar(value=self.config.get('scan_excludes', DEFAULT_SCAN_EXCLUDES))
+        self.scan_max_depth_var = tk.StringVar(value=str(self.config.get('scan_max_depth', 0)))
+        self.scan_same_fs_var = tk.BooleanVar(value=self.config.get('scan_same_filesystem', False))
+        self.scan_follow_links_var = tk.BooleanVar(value=self.config.get('scan_follow_symlinks', False))
+        ttk.Label(self.scanopts_drawer, text='Exclude (globs, comma-separated):').grid(row=0, column=0, sticky='e', padx=8, pady=(10,6))
+        ttk.Entry(self.scanopts_drawer, textvariable=self.scan_excludes_var, width=48).grid(row=0, column=1, columnspan=2, sticky='ew', padx=6, pady=(10,6))
+        ttk.Label(self.scanopts_drawer, text='Max depth (0 = unlimited):').grid(row=1, column=0, sticky='e', padx=8, pady=6)
+        ttk.Spinbox(self.scanopts_drawer, from_=0, to=999, textvariable=self.scan_max_depth_var, width=6).grid(row=1, column=1, sticky='w', padx=6, pady=6)
+        ttk.Checkbutton(self.scanopts_drawer, text="Stay on the source's filesystem", variable=self.scan_same_fs_var).grid(row=2, column=1, sticky='w', padx=6, pady=2)
+        ttk.Checkbutton(self.scanopts_drawer, text="Follow directory symlinks", variable=self.scan_follow_links_var).grid(row=3, column=1, sticky='w', padx=6, pady=2)
+        self.scan_workers_var = tk.StringVar(value=str(self.config.get('scan_workers', 0)))
+        self.scan_processes_var = tk.BooleanVar(value=self.config.get('scan_use_processes', False))
+        self.scan_sorted_var = tk.BooleanVar(value=self.config.get('scan_sorted', True))
+        ttk.Label(self.scanopts_drawer, text='Parallel workers (0 = off):').grid(row=4, column=0, sticky='e', padx=8, pady=6)
+        ttk.Spinbox(self.scanopts_drawer, from_=0, to=256, textvariable=self.scan_workers_var, width=6).grid(row=4, column=1, sticky='w', padx=6, pady=6)
+        ttk.Checkbutton(self.scanopts_drawer, text="Use processes instead of threads", variable=self.scan_processes_var).grid(row=5, column=1, sticky='w', padx=6, pady=2)
+        ttk.Checkbutton(self.scanopts_drawer, text="Sort results (reproducible previews)", variable=self.scan_sorted_var).grid(row=6, column=1, sticky='w', padx=6, pady=(2,10))
+        self.scanopts_drawer.grid_columnconfigure(1, weight=1)
+
         # Notifications / results section
         self.notifications_section = ttk.Labelframe(self.bottom_panel, text='Activity & Results')
-        self.notifications_section.grid(row=1, column=0, sticky='nsew')
-        self.bottom_panel.grid_rowconfigure(1, weight=1)
+        self.notifications_section.grid(row=2, column=0, sticky='nsew')
+        self.bottom_panel.grid_rowconfigure(2, weight=1)
         self.bottom_panel.grid_columnconfigure(0, weight=1)
 
         notif_frame = ttk.Frame(self.notifications_section)
@@ -232,7 +431,7 @@ class FileOrganizerApp:
 
         # Otherwise render checkboxes based on current vars
         for i, (ext, var) in enumerate(sorted(self.file_type_vars.items())):
-            chk = ttk.Checkbutton(self.file_types_frame, text=ext, variable=var)
+            chk = ttk.Checkbutton(self.file_types_frame, text=f"{ext} ({self.file_type_counts[ext]})", variable=var)
             chk.grid(row=i // 5, column=i % 5, sticky="w", padx=5, pady=2)
         for i in range(5):
             self.file_types_frame.grid_columnconfigure(i, weight=1)
@@ -279,6 +478,12 @@ class FileOrganizerApp:
     def cancel_add_category(self):
         self.addcat_drawer.grid_remove()
 
+    def toggle_scan_options_drawer(self):
+        if self.scanopts_drawer.winfo_ismapped():
+            self.scanopts_drawer.grid_remove()
+        else:
+            self.scanopts_drawer.grid()
+
     def notify(self, message, level='info'):
         """Append a status line to the Activity panel with optional color tag."""
         ts = time.strftime('%H:%M:%S')
@@ -322,12 +527,16 @@ class FileOrganizerApp:
         df = pd.DataFrame(log_data)
         self.last_log_df = df
         counts = df['Category'].value_counts().to_dict()
+        methods = df['Method'].value_counts().to_dict() if 'Method' in df else {}
+        linked = sum(v for k, v in methods.items() if k != 'move')
         lines = [
             f"Files Organized Successfully",
-            f"Total Files Moved: {total_files}",
+            (f"Total Files Linked: {total_files}" if linked else f"Total Files Moved: {total_files}"),
             f"Total Size: {total_size_gb} GB",
             "Breakdown by Category:" 
         ] + [f" - {k}: {v}" for k, v in counts.items()]
+        if linked:
+            lines += ["Link Methods:"] + [f" - {k}: {v}" for k, v in methods.items()]
         for line in lines:
             self.notify(line, level='success')
         # enable save button
@@ -346,6 +555,7 @@ class FileOrganizerApp:
             child.destroy()
         self.entries.clear()
         self.dest_entries.clear()
+        self.shard_entries.clear()
         self.category_rows.clear()
 
         row = 0
@@ -358,7 +568,7 @@ class FileOrganizerApp:
             ttk.Label(frame, text=cat.replace('_', ' ').title(), width=16).grid(row=0, column=0, sticky='w')
 
             # Extensions entry
-            ext_entry = ttk.Entry(frame, width=42)
+            ext_entry = ttk.Entry(frame, width=30)
             ext_entry.grid(row=0, column=1, sticky='ew', padx=(6,6))
             ext_entry.insert(0, ', '.join(self.config.get(cat, [])))
             self.entries[cat] = ext_entry
@@ -366,17 +576,26 @@ class FileOrganizerApp:
             # Destination path chooser
             dest_frame = ttk.Frame(frame)
             dest_frame.grid(row=0, column=2, sticky='ew')
-            dest_entry = ttk.Entry(dest_frame, width=32)
+            dest_entry = ttk.Entry(dest_frame, width=28)
             dest_entry.grid(row=0, column=0, sticky='ew')
             default_loc = self.config.get(f"{cat}_location", os.path.expanduser(f"~/Downloads/{cat.title()}"))
             dest_entry.insert(0, default_loc)
             ttk.Button(dest_frame, text="Browse", command=lambda c=cat: self.browse_destination(c)).grid(row=0, column=1, padx=6)
             self.dest_entries[cat] = dest_entry
 
+            # Sharding: subfolder template and max entries per folder (0 = no limit)
+            shard_entry = ttk.Entry(frame, width=14)
+            shard_entry.grid(row=0, column=3, sticky='w', padx=(0,6))
+            shard_entry.insert(0, self.config.get(f"{cat}_shard", ''))
+            limit_entry = ttk.Entry(frame, width=7)
+            limit_entry.grid(row=0, column=4, sticky='w')
+            limit_entry.insert(0, str(self.config.get(f"{cat}_shard_limit", 0)))
+            self.shard_entries[cat] = (shard_entry, limit_entry)
+
             # Delete button (protect other_files as the catch‑all)
             can_delete = cat != 'other_files'
             del_btn = ttk.Button(frame, text="Remove", state=("normal" if can_delete else "disabled"), command=lambda c=cat: self.delete_category(c))
-            del_btn.grid(row=0, column=3, padx=(6,0))
+            del_btn.grid(row=0, column=5, padx=(6,0))
 
             row += 1
 
@@ -412,14 +631,62 @@ class FileOrganizerApp:
             exts = [e if e.startswith('.') else f'.{e}' for e in exts]
             new_cfg[cat] = exts
             new_cfg[f"{cat}_location"] = self.dest_entries[cat].get()
+            shard_entry, limit_entry = self.shard_entries[cat]
+            template = shard_entry.get().strip()
+            bad = invalid_shard_placeholders(template)
+            if bad:
+                # keep the last valid template instead of building junk folders
+                template = self.config.get(f"{cat}_shard", '')
+                shard_entry.delete(0, tk.END)
+                shard_entry.insert(0, template)
+                self.notify(f"Shard template for '{cat}' rejected ({', '.join(bad)}); use {{year}}, {{month}}, {{day}} or {{hash:N}}.", level='danger')
+            new_cfg[f"{cat}_shard"] = template
+            try:
+                limit = max(0, int(limit_entry.get()))
+            except ValueError:
+                limit = 0
+            if limit == 1:
+                # a folder needs room for a file and an overflow folder
+                limit = 2
+                limit_entry.delete(0, tk.END)
+                limit_entry.insert(0, '2')
+                self.notify(f"Max/Dir for '{cat}' raised to 2, the smallest usable limit.", level='warning')
+            new_cfg[f"{cat}_shard_limit"] = limit
         # Ensure other_files exists as a catch‑all bucket (can be empty list)
         if 'other_files' not in new_cfg:
             new_cfg['other_files'] = []
             new_cfg['other_files_location'] = os.path.expanduser('~/Downloads/Other')
+        new_cfg.update(self._collect_options())
         self.config = new_cfg
         self.save_config()
         self.notify("Category settings saved.", level='success')
 
+    def _collect_options(self):
+        """Non-category settings that must survive a rebuild of the config."""
+        try:
+            max_depth = max(0, int(self.scan_max_depth_var.get()))
+        except ValueError:
+            max_depth = 0
+        try:
+            workers = max(0, int(self.scan_workers_var.get()))
+        except ValueError:
+            workers = 0
+        options = {
+            'organize_mode': self.organize_mode_var.get(),
+            'scan_excludes': self.scan_excludes_var.get(),
+            'scan_max_depth': max_depth,
+            'scan_same_filesystem': self.scan_same_fs_var.get(),
+            'scan_follow_symlinks': self.scan_follow_links_var.get(),
+            'scan_workers': workers,
+            'scan_use_processes': self.scan_processes_var.get(),
+            'scan_sorted': self.scan_sorted_var.get(),
+        }
+        # throughput measured by past runs, used for duration estimates
+        for key in THROUGHPUT_KEYS:
+            if key in self.config:
+                options[key] = self.config[key]
+        return options
+
     # ------------------ CATEGORY MGMT ------------------
     def add_category_dialog(self):
         dlg = Toplevel(self.root)
@@ -488,6 +755,8 @@ class FileOrganizerApp:
                 self.categories.remove(cat)
             self.config.pop(cat, None)
             self.config.pop(f"{cat}_location", None)
+            self.config.pop(f"{cat}_shard", None)
+            self.config.pop(f"{cat}_shard_limit", None)
             self.rebuild_category_rows()
             self.update_config()
 
@@ -514,25 +783,17 @@ class FileOrganizerApp:
             widget.destroy()
         self.file_type_vars.clear()
 
-        files = []
-        if self.recursive_var.get():
-            for root, _, filenames in os.walk(source_folder):
-                files.extend(os.path.join(root, f) for f in filenames)
-        else:
-            files = glob.glob(os.path.join(source_folder, '*'))
+        files = self._iter_files(source_folder)
 
-        extensions = set()
-        for file_path in files:
-            if os.path.isfile(file_path):
-                ext = os.path.splitext(file_path)[1].lower()
-                if ext:
-                    extensions.add(ext)
+        # extension histogram over the merged scan results
+        self.file_type_counts = Counter(os.path.splitext(f)[1].lower() for f in files)
+        self.file_type_counts.pop('', None)
 
         # grid nicely 5 columns
-        for i, ext in enumerate(sorted(extensions)):
+        for i, ext in enumerate(sorted(self.file_type_counts)):
             var = tk.BooleanVar()
             self.file_type_vars[ext] = var
-            chk = ttk.Checkbutton(self.file_types_frame, text=ext, variable=var)
+            chk = ttk.Checkbutton(self.file_types_frame, text=f"{ext} ({self.file_type_counts[ext]})", variable=var)
             chk.grid(row=i // 5, column=i % 5, sticky="w", padx=5, pady=2)
 
         for i in range(5):
@@ -553,14 +814,106 @@ class FileOrganizerApp:
         entry.insert(0, ', '.join(current_extensions))
 
     # ------------------ PREVIEW & ORGANIZE ------------------
+    def _scan_options(self, source_folder):
+        """Build the pruning options passed to scan_directory for this source."""
+        opts = self._collect_options()
+        max_depth = opts['scan_max_depth'] or None
+        if not self.recursive_var.get():
+            max_depth = 0
+        excludes = [p.strip() for p in opts['scan_excludes'].split(',') if p.strip()]
+        # Never descend into category destinations that live under the source,
+        # including ones edited in the rows but not saved yet
+        destinations = [v for k, v in self.config.items() if k.endswith('_location') and isinstance(v, str)]
+        destinations += [entry.get() for entry in self.dest_entries.values()]
+        skip_dirs = set()
+        for value in destinations:
+            if value:
+                try:
+                    st = os.stat(value)
+                except OSError:
+                    continue  # not created yet, so it can't be in the tree
+                skip_dirs.add((st.st_dev, st.st_ino))
+        root_dev = os.stat(source_folder).st_dev if opts['scan_same_filesystem'] else None
+        return {
+            'excludes': excludes,
+            'max_depth': max_depth,
+            'root_dev': root_dev,
+            'follow_symlinks': opts['scan_follow_symlinks'],
+            'skip_dirs': skip_dirs,
+        }
+
     def _iter_files(self, source_folder):
-        files = []
-        if self.recursive_var.get():
-            for root, _, filenames in os.walk(source_folder):
-                files.extend(os.path.join(root, f) for f in filenames)
+        """List source files, pruning excluded subtrees during the walk.
+
+        Stats gathered while listing are kept in self.scan_stats so later
+        stages (pre-flight, organize) don't stat every file again.
+        """
+        source_folder = os.path.abspath(source_folder)
+        options = self._scan_options(source_folder)
+        opts = self._collect_options()
+        if opts['scan_workers'] > 0:
+            found = self._walk_parallel(source_folder, options, opts['scan_workers'], opts['scan_use_processes'])
         else:
-            files = glob.glob(os.path.join(source_folder, '*'))
-        return files
+            found = self._walk_sequential(source_folder, options)
+        # shard overflow is assigned in file order, so preview and organize
+        # only agree when that order is fixed
+        shard_limited = any(self.config.get(f"{cat}_shard_limit") for cat in self.categories)
+        if opts['scan_sorted'] or shard_limited:
+            found.sort(key=lambda item: item[0])
+        self.scan_stats = dict(found)
+        return [file_path for file_path, _ in found]
+
+    def _new_subdirs(self, subdirs, visited):
+        """Drop directories already reached through another (symlinked) path."""
+        fresh = []
+        for sub_path, sub_depth, key in subdirs:
+            if key is not None:
+                # following symlinks can revisit a directory (or loop forever)
+                if key in visited:
+                    continue
+                visited.add(key)
+            fresh.append((sub_path, sub_depth))
+        return fresh
+
+    def _walk_sequential(self, source_folder, options):
+        root_st = os.stat(source_folder)
+        visited = {(root_st.st_dev, root_st.st_ino)}
+        pending = [(source_folder, 0)]
+        found = []
+        while pending:
+            path, depth = pending.pop()
+            files, subdirs = scan_directory(path, depth, options)
+            found.extend(files)
+            pending.extend(reversed(self._new_subdirs(subdirs, visited)))
+        return found
+
+    def _walk_parallel(self, source_folder, options, workers, use_processes):
+        """Walk the tree with one pool task per directory.
+
+        Subdirectories are submitted as soon as their parent is listed, so the
+        tree is partitioned dynamically and idle workers pick up whatever is
+        queued next instead of waiting on a fixed share. This keeps many
+        directory reads in flight, which fast arrays and high-latency network
+        filesystems reward. Output order depends on completion order; sort
+        afterwards when it must be reproducible.
+        """
+        root_st = os.stat(source_folder)
+        visited = {(root_st.st_dev, root_st.st_ino)}
+        found = []
+        pool_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        if use_processes and sys.platform == 'win32':
+            workers = min(workers, WINDOWS_MAX_PROCESS_WORKERS)
+        with pool_cls(max_workers=workers) as pool:
+            running = {pool.submit(scan_directory, source_folder, 0, options)}
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    files, subdirs = future.result()
+                    found.extend(files)
+                    for sub_path, sub_depth in self._new_subdirs(subdirs, visited):
+                        running.add(pool.submit(scan_directory, sub_path, sub_depth, options))
+                self.root.update()
+        return found
 
     def _match_category_and_destination(self, file_extension, base_filename):
         destination = None
@@ -577,6 +930,176 @@ class FileOrganizerApp:
                 break
         return destination, category_tag
 
+    def _shard_destination(self, destination, category_tag, file_path, dir_counts):
+        """Apply the category's sharding template (and size cap) to destination.
+
+        dir_counts caches entries per folder, counting files already planned
+        in this run, so preview and organize pick the same folders. A folder
+        that has reached the cap spills over into '<folder>/_1', '<folder>/_2',
+        ... (nesting further as those fill), which stay inside the destination
+        so scans keep skipping them.
+        """
+        template = self.config.get(f"{category_tag}_shard", '')
+        limit = self.config.get(f"{category_tag}_shard_limit", 0)
+        if not template and not limit:
+            return destination
+        st = self.scan_stats.get(file_path) or os.stat(file_path)
+        subpath = shard_subpath(template, os.path.basename(file_path), st.st_mtime)
+        base = os.path.join(destination, subpath) if subpath else destination
+        if not limit:
+            return base
+        # Overflow folders form a tree numbered breadth-first (0 = base);
+        # each folder keeps `fanout` of its `limit` slots for its own _1.._N
+        # children, so no folder ever exceeds the limit. The open node is
+        # remembered per base so each call resumes instead of re-probing.
+        fanout = max(1, limit // 2)
+        node = dir_counts.get((base, 'open'), 0)
+        while True:
+            candidate = overflow_folder(base, node, fanout)
+            if candidate not in dir_counts:
+                dir_counts[candidate] = count_shard_files(candidate)
+            if dir_counts[candidate] < limit - fanout:
+                break
+            node += 1
+        dir_counts[(base, 'open')] = node
+        dir_counts[candidate] += 1
+        return candidate
+
+    def _link_file(self, src, dst):
+        """Place src at dst without copying data; returns the method used.
+
+        Hardlinks and reflinks only work within one filesystem, so other
+        device pairs go straight to a symlink. Methods are always tried best
+        first; only a failure that applies to the whole device pair (e.g.
+        EXDEV, EOPNOTSUPP) rules a method out for later files. Per-file
+        failures such as EMLINK or EPERM do not.
+        """
+        pair = (os.stat(src).st_dev, os.stat(os.path.dirname(dst)).st_dev)
+        methods = ['hardlink', 'reflink', 'symlink'] if pair[0] == pair[1] else ['symlink']
+        unsupported = self.link_unsupported.setdefault(pair, set())
+        methods = [m for m in methods if m not in unsupported] or methods[-1:]
+        actions = {
+            'hardlink': lambda: os.link(src, dst),
+            'reflink': lambda: reflink_file(src, dst),
+            'symlink': lambda: os.symlink(os.path.abspath(src), dst),
+        }
+        last_error = None
+        for method in methods:
+            try:
+                actions[method]()
+            except OSError as e:
+                last_error = e
+                if e.errno in DEVICE_LINK_ERRORS and method != 'symlink':
+                    unsupported.add(method)
+                continue
+            return method
+        raise last_error
+
+    def _already_linked(self, src, dst):
+        """True if dst already refers to src (hardlink, or symlink to it)."""
+        try:
+            return os.path.samefile(src, dst)
+        except OSError:
+            return False
+
+    def _existing_ancestor(self, path):
+        """Nearest existing directory at or above path (destinations may not exist yet)."""
+        path = os.path.abspath(path)
+        while not os.path.exists(path):
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+        return path
+
+    def _preflight(self, plan, mode):
+        """Check destination capacity and estimate run time before touching files.
+
+        plan is a list of (source path, destination folder) pairs. Moves within
+        one device are renames; anything else is a copy that needs free space
+        on the destination device. Link mode is metadata-only throughout.
+        Returns (level, lines) where level is 'danger' when a device does not
+        have room, 'warning' when it is nearly full, and 'info' otherwise.
+        """
+        anchors = {}   # destination folder -> (existing ancestor, device)
+        devices = {}   # device -> {'path', 'bytes', 'files'}
+        renames = copies = copy_bytes = 0
+        for file_path, destination in plan:
+            st = self.scan_stats.get(file_path)
+            if st is None:
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+            if destination not in anchors:
+                anchor = self._existing_ancestor(destination)
+                anchors[destination] = (anchor, os.stat(anchor).st_dev)
+            anchor, dev = anchors[destination]
+            if mode == 'link' or dev == st.st_dev:
+                renames += 1
+                continue
+            copies += 1
+            copy_bytes += st.st_size
+            info = devices.setdefault(dev, {'path': anchor, 'bytes': 0, 'files': 0})
+            info['bytes'] += st.st_size
+            info['files'] += 1
+
+        level = 'info'
+        lines = [f"Pre-flight: {len(plan)} files, {renames} {'link' if mode == 'link' else 'rename'} / {copies} copy operations"]
+        for dev, info in devices.items():
+            free = shutil.disk_usage(info['path']).free
+            if info['bytes'] > free:
+                status = 'INSUFFICIENT SPACE'
+                level = 'danger'
+            elif info['bytes'] > free * CAPACITY_WARN_RATIO:
+                status = 'nearly full'
+                if level != 'danger':
+                    level = 'warning'
+            else:
+                status = 'ok'
+            lines.append(
+                f"Device of {info['path']}: {info['files']} files, "
+                f"{round(info['bytes'] / (1024**3), 2)} GB needed, "
+                f"{round(free / (1024**3), 2)} GB free [{status}]"
+            )
+
+        # links and renames are both metadata-only but are timed separately
+        rename_rate = self._measured_rate('link_ops' if mode == 'link' else 'rename_ops')
+        copy_rate = self._measured_rate('copy_bytes')
+        if (renames and not rename_rate) or (copy_bytes and not copy_rate):
+            lines.append("Estimated duration: unknown (no throughput measured from past runs yet)")
+        else:
+            seconds = (renames / rename_rate if renames else 0) + (copy_bytes / copy_rate if copy_bytes else 0)
+            lines.append(f"Estimated duration: ~{format_duration(seconds)}")
+        return level, lines
+
+    def _measured_rate(self, kind):
+        """Average rate for kind ('rename_ops', 'link_ops', 'copy_bytes') per second, or None."""
+        work = self.config.get(f"{kind}_total", 0)
+        seconds = self.config.get(f"{kind.split('_')[0]}_seconds_total", 0)
+        return work / seconds if work and seconds > 0 else None
+
+    def _record_throughput(self, mode, renames, rename_time, copy_bytes, copy_time):
+        """Add this run's work and time to the totals used for future estimates.
+
+        Keeping totals rather than averaging per-run rates weights every run
+        by how much it did, so a tiny run's timer noise barely moves the
+        estimate. In link mode renames counts link operations, which are
+        kept separately from real renames.
+        """
+        kind = 'link' if mode == 'link' else 'rename'
+        measured = []
+        if renames and rename_time > 0:
+            measured.append((f"{kind}_ops_total", renames, f"{kind}_seconds_total", rename_time))
+        if copy_bytes and copy_time > 0:
+            measured.append(('copy_bytes_total', copy_bytes, 'copy_seconds_total', copy_time))
+        if not measured:
+            return
+        for work_key, work, time_key, seconds in measured:
+            self.config[work_key] = self.config.get(work_key, 0) + work
+            self.config[time_key] = self.config.get(time_key, 0) + seconds
+        self.save_config()
+
     def preview_organization(self):
         from datetime import datetime
         self.update_config()
@@ -590,7 +1113,10 @@ class FileOrganizerApp:
             self.notify("No files found to preview.", level='warning')
             return
 
+        link_mode = self.organize_mode_var.get() == 'link'
         preview_data = []
+        plan = []
+        dir_counts = {}
         for file_path in files:
             if not os.path.isfile(file_path):
                 continue
@@ -599,8 +1125,12 @@ class FileOrganizerApp:
             destination, category_tag = self._match_category_and_destination(file_extension, base_filename)
             if not destination:
                 continue
+            destination = self._shard_destination(destination, category_tag, file_path, dir_counts)
+            plan.append((file_path, destination))
             new_path = os.path.join(destination, base_filename)
-            if os.path.exists(new_path):
+            if link_mode and self._already_linked(file_path, new_path):
+                pass  # re-running link mode leaves existing links alone
+            elif os.path.exists(new_path):
                 root, ext = os.path.splitext(base_filename)
                 count = 1
                 while os.path.exists(os.path.join(destination, f"{root}_{count}{ext}")):
@@ -616,6 +1146,10 @@ class FileOrganizerApp:
             self.notify("No previewable file operations were detected.", level='warning')
             return
 
+        level, preflight = self._preflight(plan, self.organize_mode_var.get())
+        for line in preflight:
+            self.notify(line, level=level)
+
         save_path = filedialog.asksaveasfilename(
             initialfile="cryovault_preview.csv",
             defaultextension=".csv",
@@ -625,7 +1159,11 @@ class FileOrganizerApp:
             return
         try:
             df = pd.DataFrame(preview_data)
-            df.to_csv(save_path, index=False)
+            with open(save_path, 'w', newline='', encoding='utf-8') as f:
+                # pre-flight summary as comment lines ahead of the table
+                for line in preflight:
+                    f.write(f"# {line}\n")
+                df.to_csv(f, index=False)
             self.notify(f"Preview saved to: {save_path}", level='info')
         except Exception as e:
             self.notify(f"Failed to export preview: {e}", level='danger')
@@ -643,19 +1181,47 @@ class FileOrganizerApp:
             self.notify("No files found to organize.", level='warning')
             return
 
-        log_data = []
-        total_files = len(files)
-        self.progress["maximum"] = total_files
-        self.progress["value"] = 0
-
-        for i, file_path in enumerate(files):
+        mode = self.organize_mode_var.get()
+        plan = []
+        dir_counts = {}
+        for file_path in files:
             if not os.path.isfile(file_path):
                 continue
             base_filename = os.path.basename(file_path)
             file_extension = os.path.splitext(file_path)[1].lower()
             destination, category_tag = self._match_category_and_destination(file_extension, base_filename)
-            if not destination:
-                # skip unmatched types
+            if destination:
+                # unmatched types are skipped
+                destination = self._shard_destination(destination, category_tag, file_path, dir_counts)
+                plan.append((file_path, destination, category_tag))
+        if not plan:
+            self.notify(f"No files were {'linked' if mode == 'link' else 'moved'}.", level='warning')
+            return
+
+        # Refuse (or ask) before any file is touched
+        level, preflight = self._preflight([(f, d) for f, d, _ in plan], mode)
+        for line in preflight:
+            self.notify(line, level=level)
+        if level == 'danger':
+            self.notify("Organize cancelled: a destination does not have enough free space.", level='danger')
+            return
+        if level == 'warning' and not messagebox.askyesno("Low Disk Space", "A destination is nearly full. Organize anyway?"):
+            self.notify("Organize cancelled.", level='warning')
+            return
+
+        log_data = []
+        renames = copy_bytes = already_linked = 0
+        rename_time = copy_time = 0.0
+        total_files = len(plan)
+        self.progress["maximum"] = total_files
+        self.progress["value"] = 0
+
+        for i, (file_path, destination, category_tag) in enumerate(plan):
+            base_filename = os.path.basename(file_path)
+            if mode == 'link' and self._already_linked(file_path, os.path.join(destination, base_filename)):
+                # re-running link mode must not add file_1, file_2, ... links
+                logging.info(f"Already present, skipped: {os.path.join(destination, base_filename)}")
+                already_linked += 1
                 self.progress["value"] = i + 1
                 self.progress_label.config(text=f"{int((i + 1) / total_files * 100)}%")
                 self.root.update()
@@ -670,24 +1236,42 @@ class FileOrganizerApp:
                     while os.path.exists(os.path.join(destination, f"{root}_{count}{ext}")):
                         count += 1
                     new_path = os.path.join(destination, f"{root}_{count}{ext}")
-                shutil.move(file_path, new_path)
+                st = self.scan_stats.get(file_path) or os.stat(file_path)
+                is_copy = mode != 'link' and os.stat(destination).st_dev != st.st_dev
+                started = time.perf_counter()
+                if mode == 'link':
+                    method = self._link_file(file_path, new_path)
+                else:
+                    shutil.move(file_path, new_path)
+                    method = 'move'
+                elapsed = time.perf_counter() - started
+                if is_copy:
+                    copy_bytes += st.st_size
+                    copy_time += elapsed
+                else:
+                    renames += 1
+                    rename_time += elapsed
                 log_data.append({
                     "Time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                     "Original Path": file_path.replace("/", "\\"),
                     "New Path": new_path.replace("/", "\\"),
-                    "Category": category_tag
+                    "Category": category_tag,
+                    "Method": method
                 })
             except Exception as e:
-                logging.error(f"Error moving {file_path}: {e}")
+                logging.error(f"Error {'linking' if mode == 'link' else 'moving'} {file_path}: {e}")
 
             self.progress["value"] = i + 1
             self.progress_label.config(text=f"{int((i + 1) / total_files * 100)}%")
             self.root.update()
 
+        self._record_throughput(mode, renames, rename_time, copy_bytes, copy_time)
+        if already_linked:
+            self.notify(f"{already_linked} files were already linked and were left as they are.", level='info')
         if log_data:
             self.render_organize_summary(log_data)
         else:
-            self.notify("No files were moved.", level='warning')
+            self.notify(f"No files were {'linked' if mode == 'link' else 'moved'}.", level='warning')
 
     # ------------------ SUMMARY POPUP ------------------
     def show_organize_summary_popup(self, log_data):
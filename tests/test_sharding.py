@@ -0,0 +1,74 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("tkinter")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import main  # noqa: E402
+
+
+class Var:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+def make_app(config):
+    """FileOrganizerApp with plain stand-ins for the Tk variables (no window)."""
+    app = main.FileOrganizerApp.__new__(main.FileOrganizerApp)
+    app.config = config
+    app.categories = [k for k, v in config.items() if isinstance(v, list)]
+    app.scan_stats = {}
+    app.dest_entries = {}
+    app.recursive_var = Var(True)
+    app.organize_mode_var = Var('move')
+    app.scan_excludes_var = Var('')
+    app.scan_max_depth_var = Var('0')
+    app.scan_same_fs_var = Var(False)
+    app.scan_follow_links_var = Var(False)
+    app.scan_workers_var = Var('0')
+    app.scan_processes_var = Var(False)
+    app.scan_sorted_var = Var(True)
+    return app
+
+
+def test_overflow_stays_inside_vault_and_is_not_rescanned(tmp_path):
+    src = tmp_path / 'src'
+    vault = src / 'vault'
+    vault.mkdir(parents=True)
+    for i in range(25):
+        (src / f'photo{i}.jpg').write_text('x')
+    limit = 4
+    app = make_app({
+        'image': ['.jpg'],
+        'image_location': str(vault),
+        'image_shard': '',
+        'image_shard_limit': limit,
+    })
+
+    dir_counts = {}
+    for file_path in app._iter_files(str(src)):
+        destination = app._shard_destination(str(vault), 'image', file_path, dir_counts)
+        assert os.path.commonpath([destination, str(vault)]) == str(vault)
+        os.makedirs(destination, exist_ok=True)
+        shutil.move(file_path, os.path.join(destination, os.path.basename(file_path)))
+
+    placed = 0
+    for _, dirnames, filenames in os.walk(vault):
+        assert len(dirnames) + len(filenames) <= limit
+        placed += len(filenames)
+    assert placed == 25
+    assert app._iter_files(str(src)) == []
+
+
+def test_shard_subpath_placeholders():
+    assert main.shard_subpath('{hash:3}/../{hash}', 'a.jpg', 0) == os.path.join('394', '39')
+    assert main.invalid_shard_placeholders('{year}/{month}/{day}/{hash}/{hash:4}') == []
+    assert main.invalid_shard_placeholders('{Year}/{months}/{foo}') == ['Year', 'months', 'foo']
+    assert main.invalid_shard_placeholders('{year') == ['unbalanced braces']